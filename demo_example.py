@@ -2,24 +2,31 @@
 Demo example showing sample output for assignment documentation.
 Run this to generate example output without needing API key.
 """
+import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
-import random
-from services.data_processor import DataProcessor
+from services.data_processor import calculate_stats, format_as_table, to_dataframe
 
-def generate_sample_data():
+try:
+    import numexpr as ne
+except ImportError:
+    ne = None
+
+def generate_sample_data(hours=72):
     """Generate realistic mock electricity data."""
-    start = datetime(2024, 1, 15, 0, 0, 0)
-    times = [start + timedelta(hours=i) for i in range(72)]
-    
+    times = pd.date_range("2024-01-15", periods=hours, freq="H", tz="UTC")
+
     # Simulate hydro production with realistic variance
     base_value = 1200
-    values = [base_value + random.uniform(-100, 150) for _ in times]
-    
-    return [
-        {"start_time": t.isoformat() + "Z", "value": round(v, 2)}
-        for t, v in zip(times, values)
-    ]
+    noise = np.random.uniform(-100, 150, hours)
+    if ne is not None and hours >= 10_000:
+        # numexpr's blocked, threaded evaluation only pays off on
+        # large arrays (e.g. minute-resolution demos)
+        values = ne.evaluate("base_value + noise")
+    else:
+        values = base_value + noise
+    values = np.round(values, 2)
+
+    return pd.DataFrame({"start_time": times, "value": values})
 
 
 def main():
@@ -33,14 +40,13 @@ def main():
     
     # Generate and process sample data
     mock_data = generate_sample_data()
-    processor = DataProcessor()
-    df = processor.to_dataframe(mock_data)
-    stats = processor.calculate_stats(df)
+    df = to_dataframe(mock_data)
+    stats = calculate_stats(df)
     
     # Display table
     print("\n📊 DATA TABLE (Sample - showing first 10 rows):")
     print("-"*70)
-    table = processor.format_as_table(df, max_rows=10)
+    table = format_as_table(df, max_rows=10)
     print(table)
     
     # Display statistics
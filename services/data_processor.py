@@ -1,93 +1,155 @@
 """
 Data processing service for Fingrid electricity data.
 """
-import pandas as pd
-from tabulate import tabulate
+import numpy as np
+
 from utils.error_handler import DataProcessingError
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _stats_kernel(values):
+    """Compute (mean, max, min, sample std) in one pass over a float64 array."""
+    n = values.shape[0]
+    total = 0.0
+    total_sq = 0.0
+    minimum = values[0]
+    maximum = values[0]
+    for i in range(n):
+        x = values[i]
+        total += x
+        total_sq += x * x
+        if x < minimum:
+            minimum = x
+        if x > maximum:
+            maximum = x
+    mean = total / n
+    variance = (total_sq - n * mean * mean) / (n - 1) if n > 1 else 0.0
+    return mean, maximum, minimum, variance ** 0.5
+
+
+if njit is not None:
+    # JIT-compile the fused loop; cache=True pays the compile cost once
+    _stats_kernel = njit(cache=True, fastmath=True)(_stats_kernel)
+else:
+    def _stats_kernel(values):
+        """Compute (mean, max, min, sample std) with NumPy reductions."""
+        return (
+            values.mean(),
+            values.max(),
+            values.min(),
+            values.std(ddof=1) if values.shape[0] > 1 else 0.0,
+        )
+
+
+def to_dataframe(data):
+    """
+    Convert raw API response to pandas DataFrame.
+
+    Args:
+        data (list or pd.DataFrame): Raw data from API, or an
+            already-built DataFrame (passed through unchanged apart
+            from timestamp parsing).
+
+    Returns:
+        pd.DataFrame: Processed dataframe.
+    """
+    # Deferred so menu-only sessions never pay the pandas import
+    import pandas as pd
+
+    try:
+        if isinstance(data, pd.DataFrame):
+            df = data
+        elif not data:
+            return pd.DataFrame()
+        else:
+            first = data[0]
+            if isinstance(first, dict) and "start_time" in first and "value" in first:
+                # Known schema: skip the column-inference pass
+                df = pd.DataFrame.from_records(data, columns=("start_time", "value"))
+            else:
+                # Schema drift: fall back to full inference so the real
+                # columns survive instead of coming back all-NaN
+                df = pd.DataFrame(data)
+        if "start_time" in df.columns and not pd.api.types.is_datetime64_any_dtype(df["start_time"]):
+            # Explicit ISO8601 format with caching avoids per-row
+            # format inference on large responses
+            df["start_time"] = pd.to_datetime(
+                df["start_time"], format="ISO8601", cache=True, utc=True
+            )
+        if "value" in df.columns:
+            df["value"] = df["value"].astype("float64")
+        return df
+    except Exception as e:
+        raise DataProcessingError(f"Failed to convert data to dataframe: {e}")
+
+
+def calculate_stats(df):
+    """
+    Calculate statistics for the data.
+
+    Args:
+        df (pd.DataFrame): The data frame.
+
+    Returns:
+        dict: Statistics including mean, max, min, median, and count.
+    """
+    try:
+        if df.empty or "value" not in df.columns:
+            return {}
+        # Work on the raw float64 array; the fused kernel does one
+        # pass instead of separate pandas reductions. Drop NaN rows
+        # first to match the skipna behaviour of the pandas reductions.
+        values = df["value"].to_numpy(dtype=np.float64)
+        values = values[~np.isnan(values)]
+        if values.size == 0:
+            return {}
+        mean, maximum, minimum, std_dev = _stats_kernel(values)
+        return {
+            "average": mean,
+            "maximum": maximum,
+            "minimum": minimum,
+            "median": np.median(values),
+            "std_dev": std_dev,
+            "count": len(df),
+        }
+    except Exception as e:
+        raise DataProcessingError(f"Failed to calculate statistics: {e}")
+
+
+def format_as_table(df, max_rows=20):
+    """
+    Format data as a readable table for console display.
+
+    Args:
+        df (pd.DataFrame): The data frame.
+        max_rows (int): Maximum rows to display.
+
+    Returns:
+        str: Formatted table string.
+    """
+    from tabulate import tabulate
+
+    try:
+        if df.empty:
+            return "No data available."
+
+        # Limit rows first, then build fresh display columns so the
+        # source frame is never copied or mutated
+        head = df.head(max_rows)
+        display = {}
+        if "start_time" in head.columns:
+            display["start_time"] = head["start_time"].dt.strftime("%Y-%m-%d %H:%M:%S")
+        display["value"] = head["value"].round(2)
+
+        table = tabulate(display, headers="keys", tablefmt="grid", showindex=False)
+
+        if len(df) > max_rows:
+            table += f"\n... (showing {max_rows} of {len(df)} rows)"
 
-class DataProcessor:
-    """Process and analyze electricity data from Fingrid API."""
-    
-    @staticmethod
-    def to_dataframe(data):
-        """
-        Convert raw API response to pandas DataFrame.
-        
-        Args:
-            data (list): Raw data from API.
-            
-        Returns:
-            pd.DataFrame: Processed dataframe.
-        """
-        try:
-            if not data:
-                return pd.DataFrame()
-            df = pd.DataFrame(data)
-            if "start_time" in df.columns:
-                df["start_time"] = pd.to_datetime(df["start_time"])
-            return df
-        except Exception as e:
-            raise DataProcessingError(f"Failed to convert data to dataframe: {e}")
-
-    @staticmethod
-    def calculate_stats(df):
-        """
-        Calculate statistics for the data.
-        
-        Args:
-            df (pd.DataFrame): The data frame.
-            
-        Returns:
-            dict: Statistics including mean, max, min, median, and count.
-        """
-        try:
-            if df.empty or "value" not in df.columns:
-                return {}
-            return {
-                "average": df["value"].mean(),
-                "maximum": df["value"].max(),
-                "minimum": df["value"].min(),
-                "median": df["value"].median(),
-                "std_dev": df["value"].std(),
-                "count": len(df),
-            }
-        except Exception as e:
-            raise DataProcessingError(f"Failed to calculate statistics: {e}")
-    
-    @staticmethod
-    def format_as_table(df, max_rows=20):
-        """
-        Format data as a readable table for console display.
-        
-        Args:
-            df (pd.DataFrame): The data frame.
-            max_rows (int): Maximum rows to display.
-            
-        Returns:
-            str: Formatted table string.
-        """
-        try:
-            if df.empty:
-                return "No data available."
-            
-            # Select relevant columns and limit rows
-            display_cols = ["start_time", "value"] if "start_time" in df.columns else ["value"]
-            display_df = df[display_cols].head(max_rows).copy()
-            
-            # Format timestamp column if present
-            if "start_time" in display_df.columns:
-                display_df["start_time"] = display_df["start_time"].dt.strftime("%Y-%m-%d %H:%M:%S")
-            
-            # Round numeric columns to 2 decimal places
-            for col in display_df.select_dtypes(include=['float64', 'float32']).columns:
-                display_df[col] = display_df[col].round(2)
-            
-            table = tabulate(display_df, headers="keys", tablefmt="grid", showindex=False)
-            
-            if len(df) > max_rows:
-                table += f"\n... (showing {max_rows} of {len(df)} rows)"
-            
-            return table
-        except Exception as e:
-            raise DataProcessingError(f"Failed to format table: {e}")
+        return table
+    except Exception as e:
+        raise DataProcessingError(f"Failed to format table: {e}")
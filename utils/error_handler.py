@@ -1,6 +1,11 @@
 """
 Error handling utilities for the Fingrid data application.
 """
+import re
+from datetime import datetime
+
+# Accepted time shapes: YYYY-MM-DD, YYYY-MM-DDTHH:MM:SS, YYYY-MM-DDTHH:MM:SSZ
+_TIME_RE = re.compile(r"^\d{4}-\d{2}-\d{2}(T\d{2}:\d{2}:\d{2}Z?)?$")
 
 
 class FingridAPIError(Exception):
@@ -28,24 +33,25 @@ class DataProcessingError(FingridAPIError):
     pass
 
 
+# Built once at import time; handle_error only does a dict lookup
+_ERROR_MESSAGES = {
+    AuthenticationError: "Authentication failed. Please check your API key.",
+    NetworkError: "Network error. Please check your internet connection.",
+    ValidationError: "Invalid input. Please check the provided parameters.",
+    DataProcessingError: "Error processing data. Please try again.",
+    ValueError: "Invalid value provided. Please check your input.",
+    ConnectionError: "Failed to connect to the API. Please try again later.",
+}
+
+
 def handle_error(e):
     """
     Handle and display errors appropriately.
-    
+
     Args:
         e (Exception): The exception to handle.
     """
-    error_messages = {
-        AuthenticationError: "Authentication failed. Please check your API key.",
-        NetworkError: "Network error. Please check your internet connection.",
-        ValidationError: "Invalid input. Please check the provided parameters.",
-        DataProcessingError: "Error processing data. Please try again.",
-        ValueError: "Invalid value provided. Please check your input.",
-        ConnectionError: "Failed to connect to the API. Please try again later.",
-    }
-    
-    error_type = type(e)
-    message = error_messages.get(error_type, str(e))
+    message = _ERROR_MESSAGES.get(type(e), str(e))
     
     print(f"\n❌ Error: {message}")
     if str(e) and str(e) != message:
@@ -62,15 +68,11 @@ def validate_time_format(time_str):
     Returns:
         bool: True if valid, False otherwise.
     """
-    from datetime import datetime
-    try:
-        # Try multiple ISO formats
-        for fmt in ["%Y-%m-%dT%H:%M:%SZ", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d"]:
-            try:
-                datetime.strptime(time_str, fmt)
-                return True
-            except ValueError:
-                continue
+    if not _TIME_RE.match(time_str):
         return False
-    except Exception:
+    try:
+        # Semantic check (month/day ranges) on the regex-validated shape
+        datetime.fromisoformat(time_str.rstrip("Z"))
+        return True
+    except ValueError:
         return False